@@ -2,10 +2,12 @@ from .base import HuggingFaceBackend
 from .dolly import backend_dolly_hf
 from .openllama import backend_openllama_hf
 from .stablelm import backend_stablelm_hf
+from .vllm import backend_vllm
 
 __all__ = [
     "HuggingFaceBackend",
     "backend_dolly_hf",
     "backend_openllama_hf",
     "backend_stablelm_hf",
+    "backend_vllm",
 ]
@@ -1,10 +1,12 @@
 import abc
+import functools
 import warnings
-from typing import Any, Dict, Iterable, Optional, Tuple, TypeVar
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple, TypeVar
 
 from thinc.compat import has_torch_cuda_gpu
 
-from ....compat import has_accelerate, has_torch, has_transformers, torch
+from ....compat import has_accelerate, has_bitsandbytes, has_torch, has_transformers
+from ....compat import torch, transformers
 
 # Type of prompts returned from Task.generate_prompts().
 _PromptType = TypeVar("_PromptType")
@@ -12,6 +14,51 @@ _PromptType = TypeVar("_PromptType")
 _ResponseType = TypeVar("_ResponseType")
 
 
+@functools.lru_cache()
+def _compile_default_configs() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Compiles default init and run configs for HF models. Cached, as this only depends on the environment.
+    RETURNS (Tuple[Dict[str, Any], Dict[str, Any]]): HF model default init config, HF model default run config.
+    """
+    default_cfg_init: Dict[str, Any] = {}
+    default_cfg_run: Dict[str, Any] = {}
+
+    if has_torch:
+        default_cfg_init["torch_dtype"] = torch.bfloat16
+        if has_accelerate:
+            # Instantiates the model with empty weights and loads the checkpoint directly into them (and onto
+            # the target devices), instead of allocating randomly initialized weights first. This roughly halves
+            # peak memory usage and load time.
+            default_cfg_init["low_cpu_mem_usage"] = True
+        if has_torch_cuda_gpu:
+            if has_accelerate:
+                # Spread models across all visible GPUs, keeping GPU 0 as free as possible as it also holds the
+                # inputs. With a single GPU, load the model entirely on it.
+                default_cfg_init["device_map"] = (
+                    "balanced_low_0" if torch.cuda.device_count() > 1 else {"": 0}
+                )
+                if has_bitsandbytes:
+                    # 8-bit weights halve memory usage and bandwidth per decoding step. Loading quantized weights
+                    # requires accelerate.
+                    default_cfg_init["quantization"] = "8bit"
+            else:
+                # this ensures it fails explicitely when GPU is not enabled or sufficient
+                default_cfg_init["device"] = "cuda:0"
+        elif has_accelerate:
+            # accelerate will distribute the layers depending on availability on GPU/CPU/hard drive
+            default_cfg_init["device_map"] = "auto"
+            warnings.warn(
+                "Couldn't find a CUDA GPU, so the setting 'device_map:auto' will be used, which may result "
+                "in the LLM being loaded (partly) on the CPU or even the hard disk, which may be slow. "
+                "Install cuda to be able to load and run the LLM on the GPU instead."
+            )
+        else:
+            raise ValueError(
+                "Install CUDA to load and run the LLM on the GPU, or install 'accelerate' to dynamically "
+                "distribute the LLM on the CPU or even the hard disk. The latter may be slow."
+            )
+    return default_cfg_init, default_cfg_run
+
+
 class HuggingFaceBackend(abc.ABC):
     """Backend for HuggingFace models."""
 
@@ -32,6 +79,12 @@ class HuggingFaceBackend(abc.ABC):
         self._model_name = model
         self._config_init, self._config_run = self.compile_default_configs()
         if config_init:
+            # An explicit device or device map from the user replaces the default placement, as the two are
+            # mutually exclusive.
+            if "device" in config_init:
+                self._config_init.pop("device_map", None)
+            if "device_map" in config_init:
+                self._config_init.pop("device", None)
             self._config_init = {**self._config_init, **config_init}
         if config_run:
             self._config_run = {**self._config_run, **config_run}
@@ -39,6 +92,7 @@ class HuggingFaceBackend(abc.ABC):
         # Init HF model.
         HuggingFaceBackend.check_installation()
         self.check_model()
+        self._compile_quantization_config()
         self._model = self.init_model()
 
     @abc.abstractmethod
@@ -50,9 +104,9 @@ class HuggingFaceBackend(abc.ABC):
 
     @property
     @abc.abstractmethod
-    def supported_models(self) -> Iterable[str]:
+    def supported_models(self) -> FrozenSet[str]:
         """Get names of supported models.
-        RETURNS (Iterable[str]): Names of supported models.
+        RETURNS (FrozenSet[str]): Names of supported models.
         """
 
     @staticmethod
@@ -73,36 +127,55 @@ class HuggingFaceBackend(abc.ABC):
         """Checks whether model is supported. Raises if it isn't."""
         if self._model_name not in self.supported_models:
             raise ValueError(
-                f"Model '{self._model_name}' is not supported - select one of {self.supported_models} instead"
+                f"Model '{self._model_name}' is not supported - select one of {sorted(self.supported_models)} instead"
             )
 
+    def _compile_quantization_config(self) -> None:
+        """Replaces the `quantization` setting in the init config (one of "4bit", "8bit" or None) with the
+        corresponding `quantization_config` object expected by `transformers`.
+        """
+        quantization = self._config_init.pop("quantization", None)
+        if not quantization:
+            return
+        if not has_bitsandbytes:
+            raise ValueError(
+                f"Quantization ('{quantization}') requires `bitsandbytes` to be installed, which it is not. Install "
+                "it with `pip install bitsandbytes` or set `quantization` to `null`."
+            )
+        if not has_accelerate:
+            raise ValueError(
+                f"Quantization ('{quantization}') requires `accelerate` to be installed, which it is not. Install "
+                "it with `pip install accelerate` or set `quantization` to `null`."
+            )
+
+        if quantization == "8bit":
+            quantization_config = transformers.BitsAndBytesConfig(load_in_8bit=True)
+        elif quantization == "4bit":
+            quantization_config = transformers.BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_compute_dtype=torch.bfloat16,
+                bnb_4bit_use_double_quant=True,
+                bnb_4bit_quant_type="nf4",
+            )
+        else:
+            raise ValueError(
+                f"Unsupported quantization '{quantization}' - select one of '4bit', '8bit' or null instead."
+            )
+        self._config_init["quantization_config"] = quantization_config
+
+        # Quantized models can't be moved to another device after loading, so they have to be placed by
+        # `transformers` (i. e. `accelerate`) directly.
+        if "device" in self._config_init:
+            self._config_init["device_map"] = {"": self._config_init.pop("device")}
+
     @staticmethod
     def compile_default_configs() -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """Compiles default init and run configs for HF model.
         RETURNS (Tuple[Dict[str, Any], Dict[str, Any]]): HF model default init config, HF model default run config.
         """
-        default_cfg_init: Dict[str, Any] = {}
-        default_cfg_run: Dict[str, Any] = {}
-
-        if has_torch:
-            default_cfg_init["torch_dtype"] = torch.bfloat16
-            if has_torch_cuda_gpu:
-                # this ensures it fails explicitely when GPU is not enabled or sufficient
-                default_cfg_init["device"] = "cuda:0"
-            elif has_accelerate:
-                # accelerate will distribute the layers depending on availability on GPU/CPU/hard drive
-                default_cfg_init["device_map"] = "auto"
-                warnings.warn(
-                    "Couldn't find a CUDA GPU, so the setting 'device_map:auto' will be used, which may result "
-                    "in the LLM being loaded (partly) on the CPU or even the hard disk, which may be slow. "
-                    "Install cuda to be able to load and run the LLM on the GPU instead."
-                )
-            else:
-                raise ValueError(
-                    "Install CUDA to load and run the LLM on the GPU, or install 'accelerate' to dynamically "
-                    "distribute the LLM on the CPU or even the hard disk. The latter may be slow."
-                )
-        return default_cfg_init, default_cfg_run
+        # Return copies, as callers may modify these.
+        default_cfg_init, default_cfg_run = _compile_default_configs()
+        return dict(default_cfg_init), dict(default_cfg_run)
 
     @abc.abstractmethod
     def init_model(self) -> Any:
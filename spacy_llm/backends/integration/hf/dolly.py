@@ -1,28 +1,43 @@
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
 
-from spacy.util import SimpleFrozenDict, SimpleFrozenList
+from spacy.util import SimpleFrozenDict
 
 from ....compat import transformers
 from ....registry.util import registry
 from . import HuggingFaceBackend
 
 
+_SUPPORTED_MODELS: FrozenSet[str] = frozenset(
+    {
+        "databricks/dolly-v2-3b",
+        "databricks/dolly-v2-7b",
+        "databricks/dolly-v2-12b",
+    }
+)
+
+
 class DollyBackend(HuggingFaceBackend):
     def init_model(self) -> Any:
         """Sets up HF model and needed utilities.
         RETURNS (Any): HF model.
         """
-        return transformers.pipeline(model=self._model_name, **self._config_init)
+        init_cfg = dict(self._config_init)
+        # `transformers.pipeline()` only forwards model-specific settings via `model_kwargs`.
+        model_kwargs = {
+            key: init_cfg.pop(key)
+            for key in ("quantization_config", "low_cpu_mem_usage")
+            if key in init_cfg
+        }
+        if model_kwargs:
+            init_cfg["model_kwargs"] = {
+                **init_cfg.get("model_kwargs", {}),
+                **model_kwargs,
+            }
+        return transformers.pipeline(model=self._model_name, **init_cfg)
 
     @property
-    def supported_models(self) -> Iterable[str]:
-        return SimpleFrozenList(
-            [
-                "databricks/dolly-v2-3b",
-                "databricks/dolly-v2-7b",
-                "databricks/dolly-v2-12b",
-            ]
-        )
+    def supported_models(self) -> FrozenSet[str]:
+        return _SUPPORTED_MODELS
 
     def __call__(self, prompts: Iterable[str]) -> Iterable[str]:  # type: ignore[override]
         """Queries Dolly HF model.
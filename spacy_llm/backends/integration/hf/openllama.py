@@ -1,12 +1,22 @@
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
 
-from spacy.util import SimpleFrozenDict, SimpleFrozenList
+from spacy.util import SimpleFrozenDict
 
 from ....compat import torch, transformers
 from ....registry.util import registry
 from .base import HuggingFaceBackend
 
 
+_SUPPORTED_MODELS: FrozenSet[str] = frozenset(
+    {
+        "openlm-research/open_llama_3b_350bt_preview",
+        "openlm-research/open_llama_3b_600bt_preview",
+        "openlm-research/open_llama_7b_400bt_preview",
+        "openlm-research/open_llama_7b_700bt_preview",
+    }
+)
+
+
 class OpenLLaMaBackend(HuggingFaceBackend):
     def __init__(
         self,
@@ -41,10 +51,12 @@ class OpenLLaMaBackend(HuggingFaceBackend):
         tokenized_input_ids = [
             self._tokenizer(prompt, return_tensors="pt").input_ids for prompt in prompts
         ]
-        if self._device:
-            tokenized_input_ids = [tii.to(self._device) for tii in tokenized_input_ids]
-
         assert hasattr(self._model, "generate")
+        # Inputs have to be on the same device as the (first layer of the) model.
+        tokenized_input_ids = [
+            tii.to(self._model.device) for tii in tokenized_input_ids
+        ]
+
         return [
             self._tokenizer.decode(
                 self._model.generate(input_ids=tii, **self._config_run)[0],
@@ -53,15 +65,8 @@ class OpenLLaMaBackend(HuggingFaceBackend):
         ]
 
     @property
-    def supported_models(self) -> Iterable[str]:
-        return SimpleFrozenList(
-            [
-                "openlm-research/open_llama_3b_350bt_preview",
-                "openlm-research/open_llama_3b_600bt_preview",
-                "openlm-research/open_llama_7b_400bt_preview",
-                "openlm-research/open_llama_7b_700bt_preview",
-            ]
-        )
+    def supported_models(self) -> FrozenSet[str]:
+        return _SUPPORTED_MODELS
 
     @staticmethod
     def compile_default_configs() -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -1,11 +1,22 @@
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
 
-from spacy.util import SimpleFrozenDict, SimpleFrozenList
+from spacy.util import SimpleFrozenDict
+from thinc.compat import has_torch_cuda_gpu
 
 from ....compat import has_transformers, torch, transformers
 from ....registry.util import registry
 from .base import HuggingFaceBackend
 
+_SUPPORTED_MODELS: FrozenSet[str] = frozenset(
+    {
+        "stabilityai/stablelm-base-alpha-3b",
+        "stabilityai/stablelm-base-alpha-7b",
+        "stabilityai/stablelm-tuned-alpha-3b",
+        "stabilityai/stablelm-tuned-alpha-7b",
+    }
+)
+
+
 if has_transformers:
 
     class _StopOnTokens(transformers.StoppingCriteria):
@@ -71,10 +82,10 @@ class StableLMBackend(HuggingFaceBackend):
                 ]
             )
         ]
-        if self._device:
-            tokenized_prompts = [tp.to(self._device) for tp in tokenized_prompts]
-
         assert hasattr(self._model, "generate")
+        # Inputs have to be on the same device as the (first layer of the) model.
+        tokenized_prompts = [tp.to(self._model.device) for tp in tokenized_prompts]
+
         return [
             self._tokenizer.decode(
                 self._model.generate(**prompt, **self._config_run)[0],
@@ -84,19 +95,15 @@ class StableLMBackend(HuggingFaceBackend):
         ]
 
     @property
-    def supported_models(self) -> Iterable[str]:
-        return SimpleFrozenList(
-            [
-                "stabilityai/stablelm-base-alpha-3b",
-                "stabilityai/stablelm-base-alpha-7b",
-                "stabilityai/stablelm-tuned-alpha-3b",
-                "stabilityai/stablelm-tuned-alpha-7b",
-            ]
-        )
+    def supported_models(self) -> FrozenSet[str]:
+        return _SUPPORTED_MODELS
 
     @staticmethod
     def compile_default_configs() -> Tuple[Dict[str, Any], Dict[str, Any]]:
         default_cfg_init, default_cfg_run = HuggingFaceBackend.compile_default_configs()
+        if has_torch_cuda_gpu:
+            # StableLM runs in half precision on GPU, also when placed with a device map.
+            default_cfg_init["torch_dtype"] = torch.float16
         return (
             default_cfg_init,
             {
@@ -0,0 +1,73 @@
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from spacy.util import SimpleFrozenDict
+
+from ....compat import has_torch, has_vllm, torch, vllm
+from ....registry.util import registry
+from . import dolly, openllama, stablelm
+from .base import HuggingFaceBackend
+
+_SUPPORTED_MODELS: FrozenSet[str] = (
+    dolly._SUPPORTED_MODELS | openllama._SUPPORTED_MODELS | stablelm._SUPPORTED_MODELS
+)
+
+
+class VLLMBackend(HuggingFaceBackend):
+    """Runs HF models with vLLM, which batches all prompts of a call with continuous batching instead of generating
+    responses one prompt at a time. Note that prompts are passed on as-is, i. e. without any model-specific prompt
+    formatting.
+    """
+
+    def init_model(self) -> "vllm.LLM":
+        """Sets up vLLM model.
+        RETURNS (vllm.LLM): vLLM model.
+        """
+        if not has_vllm:
+            raise ValueError(
+                "The vLLM backend requires `vllm` to be installed, which it is not. See "
+                "https://vllm.readthedocs.io/en/latest/getting_started/installation.html for installation "
+                "instructions."
+            )
+        return vllm.LLM(model=self._model_name, **self._config_init)
+
+    def __call__(self, prompts: Iterable[str]) -> Iterable[str]:  # type: ignore[override]
+        # vLLM returns outputs in the same order as the prompts.
+        outputs = self._model.generate(
+            list(prompts), vllm.SamplingParams(**self._config_run), use_tqdm=False
+        )
+        return [output.outputs[0].text for output in outputs]
+
+    @property
+    def supported_models(self) -> FrozenSet[str]:
+        return _SUPPORTED_MODELS
+
+    def _compile_quantization_config(self) -> None:
+        # vLLM handles the `quantization` setting itself.
+        pass
+
+    @staticmethod
+    def compile_default_configs() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        default_cfg_init: Dict[str, Any] = {"dtype": "bfloat16"}
+        if has_torch and torch.cuda.is_available():
+            # Shard the model across all visible GPUs.
+            default_cfg_init["tensor_parallel_size"] = torch.cuda.device_count()
+        return default_cfg_init, {"max_tokens": 64}
+
+
+@registry.llm_backends("spacy.vLLM.v1")
+def backend_vllm(
+    model: str,
+    config_init: Optional[Dict[str, Any]] = SimpleFrozenDict(),
+    config_run: Optional[Dict[str, Any]] = SimpleFrozenDict(),
+) -> Callable[[Iterable[str]], Iterable[str]]:
+    """Returns Callable that can execute a set of prompts and return the raw responses.
+    model (str): Name of the HF model.
+    config_init (Optional[Dict[str, Any]]): Config for initializing the model with `vllm.LLM()`.
+    config_run (Optional[Dict[str, Any]]): Config for running the model, passed on to `vllm.SamplingParams()`.
+    RETURNS (Callable[[Iterable[str]], Iterable[str]]): Callable executing the prompts and returning raw responses.
+    """
+    return VLLMBackend(
+        model=model,
+        config_init=config_init,
+        config_run=config_run,
+    )
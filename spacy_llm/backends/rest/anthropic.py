@@ -1,12 +1,13 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Any, Dict, Iterable, List, Sized
 
-import requests  # type: ignore[import]
 import srsly  # type: ignore[import]
 from requests import HTTPError
+from spacy.util import SimpleFrozenDict
 
-from .base import Backend
+from .base import Backend, load_json
 
 
 class Endpoints(str, Enum):
@@ -22,6 +23,24 @@ class SystemPrompt(str, Enum):
     ASST = "\n\nAssistant:"
 
 
+_SUPPORTED_MODELS: Dict[str, str] = SimpleFrozenDict(
+    {
+        "claude-1": Endpoints.COMPLETIONS.value,
+        "claude-1-100k": Endpoints.COMPLETIONS.value,
+        "claude-instant-1": Endpoints.COMPLETIONS.value,
+        "claude-instant-1-100k": Endpoints.COMPLETIONS.value,
+        # sub-versions of the models
+        "claude-1.3": Endpoints.COMPLETIONS.value,
+        "claude-1.3-100k": Endpoints.COMPLETIONS.value,
+        "claude-1.2": Endpoints.COMPLETIONS.value,
+        "claude-1.0": Endpoints.COMPLETIONS.value,
+        "claude-instant-1.1": Endpoints.COMPLETIONS.value,
+        "claude-instant-1.1-100k": Endpoints.COMPLETIONS.value,
+        "claude-instant-1.0": Endpoints.COMPLETIONS.value,
+    }
+)
+
+
 class AnthropicBackend(Backend):
     @property
     def supported_models(self) -> Dict[str, str]:
@@ -29,20 +48,7 @@ class AnthropicBackend(Backend):
         Based on https://console.anthropic.com/docs/api/reference
         RETURNS (Dict[str, str]): Supported models with their endpoints.
         """
-        return {
-            "claude-1": Endpoints.COMPLETIONS.value,
-            "claude-1-100k": Endpoints.COMPLETIONS.value,
-            "claude-instant-1": Endpoints.COMPLETIONS.value,
-            "claude-instant-1-100k": Endpoints.COMPLETIONS.value,
-            # sub-versions of the models
-            "claude-1.3": Endpoints.COMPLETIONS.value,
-            "claude-1.3-100k": Endpoints.COMPLETIONS.value,
-            "claude-1.2": Endpoints.COMPLETIONS.value,
-            "claude-1.0": Endpoints.COMPLETIONS.value,
-            "claude-instant-1.1": Endpoints.COMPLETIONS.value,
-            "claude-instant-1.1-100k": Endpoints.COMPLETIONS.value,
-            "claude-instant-1.0": Endpoints.COMPLETIONS.value,
-        }
+        return _SUPPORTED_MODELS
 
     @property
     def credentials(self) -> Dict[str, str]:
@@ -80,22 +86,25 @@ class AnthropicBackend(Backend):
         url = self._url if self._url else self.supported_models[self._config["model"]]
 
         def _request(json_data: Dict[str, Any]) -> Dict[str, Any]:
+            # json_data is created anew for every request, so we can add the config to it in-place instead of merging
+            # both into a new dict.
+            json_data.update(self._config)
             r = self.retry(
-                call_method=requests.post,
+                call_method=self._session.post,
                 url=url,
                 headers=headers,
-                json={**json_data, **self._config},
+                json=json_data,
                 timeout=self._max_request_time,
             )
             try:
                 r.raise_for_status()
             except HTTPError as ex:
-                res_content = srsly.json_loads(r.content.decode("utf-8"))
+                res_content = load_json(r.content)
                 # Include specific error message in exception.
                 raise ValueError(
                     f"Request to Anthropic API failed: {res_content.get('error', {})}"
                 ) from ex
-            response = r.json()
+            response = load_json(r.content)
 
             # c.f. https://console.anthropic.com/docs/api/errors
             if "error" in response:
@@ -103,17 +112,23 @@ class AnthropicBackend(Backend):
                     raise ValueError(f"API call failed: {response}.")
                 else:
                     assert isinstance(prompts, Sized)
-                    return {"error": [srsly.json_dumps(response)] * len(prompts)}
+                    return {"error": [r.text] * len(prompts)}
             return response
 
         # Anthropic API currently doesn't accept batch prompts, so we're making
-        # a request for each iteration. This approach can be prone to rate limit
-        # errors. In practice, you can adjust _max_request_time so that the
-        # timeout is larger.
-        responses = [
-            _request({"prompt": f"{SystemPrompt.HUMAN} {prompt}{SystemPrompt.ASST}"})
-            for prompt in prompts
-        ]
+        # a request for each prompt. These requests are independent, so we run them
+        # concurrently. This approach can be prone to rate limit errors. In practice,
+        # you can adjust _max_request_time so that the timeout is larger, or reduce
+        # max_workers.
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            responses = list(
+                executor.map(
+                    lambda prompt: _request(
+                        {"prompt": f"{SystemPrompt.HUMAN} {prompt}{SystemPrompt.ASST}"}
+                    ),
+                    prompts,
+                )
+            )
 
         for response in responses:
             if "completion" in response:
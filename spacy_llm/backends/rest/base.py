@@ -1,11 +1,17 @@
 import abc
+import random
+import threading
 import time
 import warnings
 from enum import Enum
 from typing import Any, Dict, Iterable, Callable, Optional
 
 import requests  # type: ignore
+import srsly  # type: ignore[import]
 from requests import ConnectTimeout, ReadTimeout
+from requests.adapters import HTTPAdapter
+
+from ...compat import has_orjson, orjson
 
 
 class _HTTPRetryErrorCodes(Enum):
@@ -17,6 +23,26 @@ class _HTTPRetryErrorCodes(Enum):
         return item in set(item.value for item in cls)
 
 
+def load_json(content: bytes) -> Any:
+    """Parses JSON response body. Uses orjson, if available, as it's considerably faster for large responses.
+    content (bytes): Raw response body.
+    RETURNS (Any): Parsed JSON.
+    """
+    if has_orjson:
+        return orjson.loads(content)
+    return srsly.json_loads(content.decode("utf-8"))
+
+
+def dump_json(data: Any) -> bytes:
+    """Serializes request body. Uses orjson, if available, as it's considerably faster.
+    data (Any): Data to serialize.
+    RETURNS (bytes): UTF-8 encoded JSON.
+    """
+    if has_orjson:
+        return orjson.dumps(data)
+    return srsly.json_dumps(data).encode("utf-8")
+
+
 class Backend(abc.ABC):
     """Queries LLMs via their REST APIs."""
 
@@ -37,7 +63,8 @@ class Backend(abc.ABC):
             Note that only response object structure will be checked, not the prompt response text per se.
         max_tries (int): Max. number of tries for API request.
         interval (float): Time interval (in seconds) for API retries in seconds. We implement a base 2 exponential
-            backoff at each retry.
+            backoff with random jitter at each retry, but wait at least as long as requested by the API's
+            Retry-After header.
         max_request_time (float): Max. time (in seconds) to wait for request to terminate before raising an exception.
         """
         self._config = config
@@ -46,6 +73,27 @@ class Backend(abc.ABC):
         self._interval = interval
         self._max_request_time = max_request_time
         self._url = self._config.pop("url") if "url" in self._config else None
+        # Max. number of concurrent requests for APIs that have to be queried prompt by prompt.
+        self._max_workers = (
+            self._config.pop("max_workers") if "max_workers" in self._config else 8
+        )
+        # Max. number of requests in flight at any time for this backend, across all concurrent calls. Requests
+        # waiting for a retry don't occupy a slot.
+        self._max_concurrent_requests = (
+            self._config.pop("max_concurrent_requests")
+            if "max_concurrent_requests" in self._config
+            else self._max_workers
+        )
+        assert self._max_workers >= 1
+        assert self._max_concurrent_requests >= 1
+        self._request_slots = threading.BoundedSemaphore(self._max_concurrent_requests)
+        # Session is shared across requests to reuse connections (and TLS sessions) instead of opening a new one for
+        # every request. The pool has to hold a connection for every request that may be in flight.
+        self._session = requests.Session()
+        pool_size = max(self._max_workers, self._max_concurrent_requests)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._credentials = self.credentials
 
         if "model" not in config:
@@ -56,6 +104,21 @@ class Backend(abc.ABC):
         assert self._interval > 0
         assert self._max_request_time > 0
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Semaphores can't be pickled (needed e.g. for multiprocessing with spawned processes).
+        state = self.__dict__.copy()
+        del state["_request_slots"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._request_slots = threading.BoundedSemaphore(self._max_concurrent_requests)
+
+    def __del__(self):
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
     @abc.abstractmethod
     def __call__(self, prompts: Iterable[str]) -> Iterable[str]:
         """Executes prompts on specified API.
@@ -73,7 +136,9 @@ class Backend(abc.ABC):
     @property
     @abc.abstractmethod
     def credentials(self) -> Dict[str, str]:
-        """Get credentials for the LLM API.
+        """Get credentials for the LLM API. This is evaluated only once at initialization and stored in
+        self._credentials, so implementations may run (expensive) access checks here. Use self._credentials
+        everywhere else.
         RETURNS (Dict[str, str]): Credentials.
         """
 
@@ -98,7 +163,8 @@ class Backend(abc.ABC):
             RETURNS (Optional[requests.Response]): Response object.
             """
             try:
-                return call_method(url, **kwargs)
+                with self._request_slots:
+                    return call_method(url, **kwargs)
             except (ConnectTimeout, ReadTimeout, TimeoutError) as err:
                 if attempt < self._max_tries:
                     return None
@@ -117,7 +183,14 @@ class Backend(abc.ABC):
         while i < self._max_tries and (
             response is None or _HTTPRetryErrorCodes.has(response.status_code)
         ):
-            time.sleep(interval)
+            # Jitter avoids concurrent requests retrying in lockstep. If the API tells us how long to wait, we don't
+            # retry any earlier than that.
+            time.sleep(
+                max(
+                    interval * random.uniform(0.5, 1.5),
+                    Backend._get_retry_after(response),
+                )
+            )
             response = _call_api(i + 1)
             i += 1
             # Increase timeout everytime you retry
@@ -132,6 +205,20 @@ class Backend(abc.ABC):
 
         return response
 
+    @staticmethod
+    def _get_retry_after(response: Optional[requests.Response]) -> float:
+        """Returns waiting time requested by the API via the Retry-After header.
+        response (Optional[requests.Response]): Response to inspect.
+        RETURNS (float): Time to wait in seconds, 0 if not specified.
+        """
+        if response is None:
+            return 0
+        try:
+            # Retry-After may also be an HTTP date, which we ignore.
+            return max(float(response.headers.get("Retry-After", 0)), 0)
+        except ValueError:
+            return 0
+
     def _check_api_endpoint_compatibility(self):
         """Checks whether specified model supports the supported API endpoint."""
         supported_models = self.supported_models
@@ -1,30 +1,36 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Sized
+from typing import Any, Dict, Iterable, Iterator, Sized
 
-import requests  # type: ignore[import]
 import srsly  # type: ignore[import]
 from requests import HTTPError
+from spacy.util import SimpleFrozenDict
 
-from .base import Backend
+from .base import Backend, load_json
 
 
 class Endpoints(str, Enum):
     COMPLETION = "https://api.cohere.ai/v1/generate"
 
 
+_SUPPORTED_MODELS: Dict[str, str] = SimpleFrozenDict(
+    {
+        "command": Endpoints.COMPLETION.value,
+        "command-nightly": Endpoints.COMPLETION.value,
+        "command-light": Endpoints.COMPLETION.value,
+        "command-light-nightly": Endpoints.COMPLETION.value,
+    }
+)
+
+
 class CohereBackend(Backend):
     @property
     def supported_models(self) -> Dict[str, str]:
         """Returns supported models with their endpoints.
         RETURNS (Dict[str, str]): Supported models with their endpoints.
         """
-        return {
-            "command": Endpoints.COMPLETION.value,
-            "command-nightly": Endpoints.COMPLETION.value,
-            "command-light": Endpoints.COMPLETION.value,
-            "command-light-nightly": Endpoints.COMPLETION.value,
-        }
+        return _SUPPORTED_MODELS
 
     @property
     def credentials(self) -> Dict[str, str]:
@@ -48,34 +54,38 @@ class CohereBackend(Backend):
         assert api_key is not None
         return headers
 
-    def __call__(self, prompts: Iterable[str]) -> Iterable[str]:
+    def __call__(self, prompts: Iterable[str]) -> Iterator[str]:
+        # Responses are yielded as soon as they're available (and in prompt order), so callers can start processing
+        # them while later requests are still in flight.
         headers = {
             **self._credentials,
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
 
-        api_responses: List[str] = []
         prompts = list(prompts)
         url = self._url if self._url else self.supported_models[self._config["model"]]
 
         def _request(json_data: Dict[str, Any]) -> Dict[str, Any]:
+            # json_data is created anew for every request, so we can add the config to it in-place instead of merging
+            # both into a new dict.
+            json_data.update(self._config)
             r = self.retry(
-                call_method=requests.post,
+                call_method=self._session.post,
                 url=url,
                 headers=headers,
-                json={**json_data, **self._config},
+                json=json_data,
                 timeout=self._max_request_time,
             )
             try:
                 r.raise_for_status()
             except HTTPError as ex:
-                res_content = srsly.json_loads(r.content.decode("utf-8"))
+                res_content = load_json(r.content)
                 # Include specific error message in exception.
                 raise ValueError(
                     f"Request to Cohere API failed: {res_content.get('message', {})}"
                 ) from ex
-            response = r.json()
+            response = load_json(r.content)
 
             # Cohere returns a 'message' key when there is an error
             # in the response.
@@ -84,23 +94,24 @@ class CohereBackend(Backend):
                     raise ValueError(f"API call failed: {response}.")
                 else:
                     assert isinstance(prompts, Sized)
-                    return {"error": [srsly.json_dumps(response)] * len(prompts)}
+                    return {"error": [r.text] * len(prompts)}
             return response
 
         # Cohere API currently doesn't accept batch prompts, so we're making
-        # a request for each iteration. This approach can be prone to rate limit
-        # errors. In practice, you can adjust _max_request_time so that the
-        # timeout is larger.
-        responses = [_request({"prompt": prompt}) for prompt in prompts]
-        for response in responses:
-            for result in response["generations"]:
-                if "text" in result:
-                    # Although you can set the number of completions in Cohere
-                    # to be greater than 1, we only need to return a single value.
-                    # In this case, we will just return the very first output.
-                    api_responses.append(result["text"])
-                    break
-                else:
-                    api_responses.append(srsly.json_dumps(response))
-
-        return api_responses
+        # a request for each prompt. These requests are independent, so we run them
+        # concurrently. This approach can be prone to rate limit errors. In practice,
+        # you can adjust _max_request_time so that the timeout is larger, or reduce
+        # max_workers.
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for response in executor.map(
+                lambda prompt: _request({"prompt": prompt}), prompts
+            ):
+                for result in response["generations"]:
+                    if "text" in result:
+                        # Although you can set the number of completions in Cohere
+                        # to be greater than 1, we only need to return a single value.
+                        # In this case, we will just return the very first output.
+                        yield result["text"]
+                        break
+                    else:
+                        yield srsly.json_dumps(response)
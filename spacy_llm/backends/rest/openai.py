@@ -1,12 +1,13 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Sized
+from typing import Any, Dict, Iterable, Iterator, Sized
 
-import requests  # type: ignore[import]
 import srsly  # type: ignore[import]
-from requests import HTTPError
+from requests import HTTPError, Response
+from spacy.util import SimpleFrozenDict
 
-from .base import Backend
+from .base import Backend, dump_json, load_json
 
 
 class Endpoints(str, Enum):
@@ -14,29 +15,52 @@ class Endpoints(str, Enum):
     NON_CHAT = "https://api.openai.com/v1/completions"
 
 
+_SUPPORTED_MODELS: Dict[str, str] = SimpleFrozenDict(
+    {
+        "gpt-4": Endpoints.CHAT.value,
+        "gpt-4-0314": Endpoints.CHAT.value,
+        "gpt-4-32k": Endpoints.CHAT.value,
+        "gpt-4-32k-0314": Endpoints.CHAT.value,
+        "gpt-3.5-turbo": Endpoints.CHAT.value,
+        "gpt-3.5-turbo-0301": Endpoints.CHAT.value,
+        "text-davinci-003": Endpoints.NON_CHAT.value,
+        "text-davinci-002": Endpoints.NON_CHAT.value,
+        "text-curie-001": Endpoints.NON_CHAT.value,
+        "text-babbage-001": Endpoints.NON_CHAT.value,
+        "text-ada-001": Endpoints.NON_CHAT.value,
+        "davinci": Endpoints.NON_CHAT.value,
+        "curie": Endpoints.NON_CHAT.value,
+        "babbage": Endpoints.NON_CHAT.value,
+        "ada": Endpoints.NON_CHAT.value,
+    }
+)
+
+
 class OpenAIBackend(Backend):
+    def __init__(
+        self,
+        config: Dict[Any, Any],
+        strict: bool,
+        max_tries: int,
+        interval: float,
+        max_request_time: float,
+    ):
+        # `stream` is only supported by the chat endpoint, so it's added to chat request bodies only.
+        self._stream = bool(config.pop("stream")) if "stream" in config else False
+        super().__init__(
+            config=config,
+            strict=strict,
+            max_tries=max_tries,
+            interval=interval,
+            max_request_time=max_request_time,
+        )
+
     @property
     def supported_models(self) -> Dict[str, str]:
         """Returns supported models with their endpoints.
         RETURNS (Dict[str, str]): Supported models with their endpoints.
         """
-        return {
-            "gpt-4": Endpoints.CHAT.value,
-            "gpt-4-0314": Endpoints.CHAT.value,
-            "gpt-4-32k": Endpoints.CHAT.value,
-            "gpt-4-32k-0314": Endpoints.CHAT.value,
-            "gpt-3.5-turbo": Endpoints.CHAT.value,
-            "gpt-3.5-turbo-0301": Endpoints.CHAT.value,
-            "text-davinci-003": Endpoints.NON_CHAT.value,
-            "text-davinci-002": Endpoints.NON_CHAT.value,
-            "text-curie-001": Endpoints.NON_CHAT.value,
-            "text-babbage-001": Endpoints.NON_CHAT.value,
-            "text-ada-001": Endpoints.NON_CHAT.value,
-            "davinci": Endpoints.NON_CHAT.value,
-            "curie": Endpoints.NON_CHAT.value,
-            "babbage": Endpoints.NON_CHAT.value,
-            "ada": Endpoints.NON_CHAT.value,
-        }
+        return _SUPPORTED_MODELS
 
     @property
     def credentials(self) -> Dict[str, str]:
@@ -59,7 +83,7 @@ class OpenAIBackend(Backend):
         if api_org:
             headers["OpenAI-Organization"] = api_org
         r = self.retry(
-            call_method=requests.get,
+            call_method=self._session.get,
             url="https://api.openai.com/v1/models",
             headers=headers,
             timeout=self._max_request_time,
@@ -74,7 +98,7 @@ class OpenAIBackend(Backend):
                 f"Error accessing api.openai.com ({r.status_code}): {r.text}"
             )
 
-        response = r.json()["data"]
+        response = load_json(r.content)["data"]
         models = [response[i]["id"] for i in range(len(response))]
         if model not in models:
             raise ValueError(
@@ -98,70 +122,117 @@ class OpenAIBackend(Backend):
         assert api_key is not None
         return headers
 
-    def __call__(self, prompts: Iterable[str]) -> Iterable[str]:
+    @staticmethod
+    def _consume_stream(r: Response) -> Dict[str, Any]:
+        """Collects the content deltas of a streamed chat completion into a single response.
+        r (Response): Response with server-sent events, each carrying a chunk of the chat completion.
+        RETURNS (Dict[str, Any]): Response in the format of a non-streamed chat completion.
+        """
+        chunks = []
+        for line in r.iter_lines():
+            if not line.startswith(b"data: ") or line == b"data: [DONE]":
+                continue
+            event = load_json(line[6:])
+            if "error" in event:
+                return event
+            # Some events (e.g. usage reports) don't carry any choices.
+            if not event.get("choices"):
+                continue
+            chunks.append(event["choices"][0].get("delta", {}).get("content") or "")
+        return {
+            "choices": [{"message": {"role": "assistant", "content": "".join(chunks)}}]
+        }
+
+    def __call__(self, prompts: Iterable[str]) -> Iterator[str]:
+        # Responses are yielded as soon as they're available (and in prompt order), so callers can start processing
+        # them while later requests are still in flight.
         headers = {
             **self._credentials,
             "Content-Type": "application/json",
         }
-        api_responses: List[str] = []
         prompts = list(prompts)
         url = self._url if self._url else self.supported_models[self._config["model"]]
+        # With `stream` set, the chat endpoint sends the response as server-sent events while it's being generated.
+        stream = url == Endpoints.CHAT and self._stream
 
-        def _request(json_data: Dict[str, Any]) -> Dict[str, Any]:
+        def _request(body: bytes) -> Dict[str, Any]:
             r = self.retry(
-                call_method=requests.post,
+                call_method=self._session.post,
                 url=url,
                 headers=headers,
-                json={**json_data, **self._config},
+                data=body,
                 timeout=self._max_request_time,
+                stream=stream,
             )
             try:
                 r.raise_for_status()
             except HTTPError as ex:
-                res_content = srsly.json_loads(r.content.decode("utf-8"))
+                res_content = load_json(r.content)
                 # Include specific error message in exception.
                 raise ValueError(
                     f"Request to OpenAI API failed: {res_content.get('error', {}).get('message', str(res_content))}"
                 ) from ex
-            responses = r.json()
+            streamed = stream and r.headers.get("Content-Type", "").startswith(
+                "text/event-stream"
+            )
+            responses = (
+                OpenAIBackend._consume_stream(r) if streamed else load_json(r.content)
+            )
 
             if "error" in responses:
                 if self._strict:
                     raise ValueError(f"API call failed: {responses}.")
                 else:
                     assert isinstance(prompts, Sized)
-                    return {"error": [srsly.json_dumps(responses)] * len(prompts)}
+                    # A streamed body has been consumed already, so we use the error event instead.
+                    error = dump_json(responses).decode("utf-8") if streamed else r.text
+                    return {"error": [error] * len(prompts)}
 
             return responses
 
         if url == Endpoints.CHAT:
             # The OpenAI API doesn't support batching for /chat/completions yet, so we have to send individual requests.
-            for prompt in prompts:
-                responses = _request(
-                    {"messages": [{"role": "user", "content": prompt}]}
-                )
-                if "error" in responses:
-                    return responses["error"]
-
-                # Process responses.
-                assert len(responses["choices"]) == 1
-                response = responses["choices"][0]
-                api_responses.append(
-                    response.get("message", {}).get(
+            # These are independent of each other, so we send them concurrently and collect them in prompt order.
+            # Only the prompt differs between request bodies, so we serialize everything else just once. The config
+            # comes last so that its values take precedence, as they do for non-chat requests.
+            body_prefix = b'{"messages":[{"role":"user","content":'
+            body_suffix = (
+                b"}],"
+                + dump_json(
+                    {**self._config, "stream": True} if stream else self._config
+                )[1:]
+            )
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                for i, responses in enumerate(
+                    executor.map(
+                        lambda prompt: _request(
+                            body_prefix + dump_json(prompt) + body_suffix
+                        ),
+                        prompts,
+                    )
+                ):
+                    if "error" in responses:
+                        # Responses for the preceding prompts have been yielded already, so the error is only
+                        # returned for the remaining ones.
+                        yield from responses["error"][i:]
+                        return
+
+                    # Process responses.
+                    assert len(responses["choices"]) == 1
+                    response = responses["choices"][0]
+                    yield response.get("message", {}).get(
                         "content", srsly.json_dumps(response)
                     )
-                )
 
         elif url == Endpoints.NON_CHAT:
-            responses = _request({"prompt": prompts})
+            responses = _request(dump_json({"prompt": prompts, **self._config}))
             if "error" in responses:
-                return responses["error"]
+                yield from responses["error"]
+                return
             assert len(responses["choices"]) == len(prompts)
 
             for response in responses["choices"]:
                 if "text" in response:
-                    api_responses.append(response["text"])
+                    yield response["text"]
                 else:
-                    api_responses.append(srsly.json_dumps(response))
-
-        return api_responses
+                    yield srsly.json_dumps(response)
@@ -32,7 +32,7 @@ def backend_rest(
         be raised.
     max_tries (int): Max. number of tries for API request.
     interval (float): Time interval (in seconds) for API retries in seconds. We implement a base 2 exponential backoff
-        at each retry.
+        with random jitter at each retry, but wait at least as long as requested by the API's Retry-After header.
     max_request_time (float): Max. time (in seconds) to wait for request to terminate before raising an exception.
     RETURNS (Callable[[Iterable[str]], Iterable[str]]]): Callable using the querying the specified API using a
         Backend instance.
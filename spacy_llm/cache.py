@@ -1,8 +1,16 @@
+import hashlib
+import mmap
+import os
+import struct
+import warnings
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 import numpy
-import srsly  # type: ignore[import]
+from spacy.attrs import ORTH
 from spacy.tokens import Doc, DocBin
 from spacy.vocab import Vocab
 
@@ -23,7 +31,13 @@ def make_cache(
 class BatchCache:
     """Utility class handling caching functionality for the `llm` component."""
 
-    _INDEX_NAME: str = "index.jsonl"
+    _INDEX_NAME: str = "index.bin"
+    # Index file written by previous versions, whose doc and batch IDs aren't compatible with the current ones.
+    _LEGACY_INDEX_NAME: str = "index.jsonl"
+    # Index files start with a magic number and format version, followed by packed (doc ID, batch ID) records. The
+    # header is as long as a record, which keeps records aligned.
+    _INDEX_HEADER: bytes = b"SLLMIDX\x01"
+    _INDEX_DTYPE = numpy.dtype([("doc", "<u8"), ("batch", "<u8")])
 
     def __init__(
         self,
@@ -46,24 +60,53 @@ class BatchCache:
 
         # Stores doc hash -> batch hash to allow efficient lookup of available Docs.
         self._doc2batch: Dict[int, int] = {}
-        # Hashes of batches loaded into memory.
-        self._batch_hashes: List[int] = []
-        # Container for currently loaded batch of Docs (batch hash -> doc hash -> Doc).
-        self._loaded_docs: Dict[int, Dict[int, Doc]] = {}
+        # Hashes of docs that have been looked up or added, so that we don't have to compute them repeatedly. Hashes
+        # aren't stored in the docs' user data, as that would be persisted with the docs.
+        self._doc_ids: "weakref.WeakKeyDictionary[Doc, int]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Container for currently loaded batches of Docs (batch hash -> batch), ordered from least to most
+        # recently used.
+        self._loaded_docs: "OrderedDict[int, _LoadedBatch]" = OrderedDict()
         # Queue for processed, not yet persisted docs.
         self._cache_queue: List[Doc] = []
+        # Stores batch hash -> hash of the batch persisted after it. Docs are usually looked up in the order they were
+        # processed in, so that's the batch we prefetch after loading a batch.
+        self._next_batch: Dict[int, int] = {}
+        self._last_batch: Optional[int] = None
+        # Background loader and the batch it is currently prefetching (batch hash, future resolving to the batch). A
+        # prefetched batch counts towards max_batches_in_mem. The loader's worker thread doesn't exist in forked
+        # processes (e.g. with nlp.pipe(n_process=...)), so we keep track of the process it was started in.
+        self._loader: Optional[ThreadPoolExecutor] = None
+        self._loader_pid: Optional[int] = None
+        self._prefetched: Optional[Tuple[int, "Future[_LoadedBatch]"]] = None
+        # Index file handle, kept open for appending once the first batch has been persisted.
+        self._index_file: Optional[BinaryIO] = None
         # Statistics.
-        self._stats: Dict[str, int] = {
-            "hit": 0,
-            "hit_contains": 0,
-            "missed": 0,
-            "missed_contains": 0,
-            "added": 0,
-            "persisted": 0,
-        }
+        self._n_hit = 0
+        self._n_hit_contains = 0
+        self._n_missed = 0
+        self._n_missed_contains = 0
+        self._n_added = 0
+        self._n_persisted = 0
 
         self._init_cache_index()
 
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Cache statistics.
+        RETURNS (Dict[str, int]): Number of cache hits and misses (for lookups and containment checks), and of added
+            and persisted docs.
+        """
+        return {
+            "hit": self._n_hit,
+            "hit_contains": self._n_hit_contains,
+            "missed": self._n_missed,
+            "missed_contains": self._n_missed_contains,
+            "added": self._n_added,
+            "persisted": self._n_persisted,
+        }
+
     @property
     def vocab(self) -> Optional[Vocab]:
         """Vocab used for deserializing docs.
@@ -87,29 +130,72 @@ class BatchCache:
             raise ValueError("Cache directory exists and is not a directory.")
         self._path.mkdir(parents=True, exist_ok=True)
 
+        if (self._path / BatchCache._LEGACY_INDEX_NAME).exists():
+            warnings.warn(
+                f"Found a cache index written by a previous version of spacy-llm in {self._path}. Docs cached by "
+                "previous versions aren't reused and will be cached again. You can delete "
+                f"'{BatchCache._LEGACY_INDEX_NAME}' and the batch files listed in it."
+            )
+
         index_path = self._index_path
         if index_path.exists():
-            for rec in srsly.read_jsonl(index_path):
-                self._doc2batch = {
-                    **self._doc2batch,
-                    **{int(k): int(v) for k, v in rec.items()},
-                }
+            with open(index_path, "rb") as index_file:
+                if (
+                    index_file.read(len(BatchCache._INDEX_HEADER))
+                    != BatchCache._INDEX_HEADER
+                ):
+                    raise ValueError(
+                        f"Cache index {index_path} has an unknown format. Delete the cache directory or configure "
+                        "another one."
+                    )
+                index = numpy.fromfile(index_file, dtype=BatchCache._INDEX_DTYPE)
+            self._doc2batch = dict(zip(index["doc"].tolist(), index["batch"].tolist()))
+            for batch_id in dict.fromkeys(index["batch"].tolist()):
+                self._set_last_batch(batch_id)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Executors, futures, weak references and the generators of loaded batches can't be pickled (needed e.g. for
+        # multiprocessing with spawned processes). Loaded batches are read from disk again when needed.
+        state = self.__dict__.copy()
+        state["_loaded_docs"] = OrderedDict()
+        state["_loader"] = None
+        state["_loader_pid"] = None
+        state["_prefetched"] = None
+        del state["_doc_ids"]
+        state["_index_file"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._doc_ids = weakref.WeakKeyDictionary()
+
+    def __del__(self):
+        index_file = getattr(self, "_index_file", None)
+        if index_file is not None:
+            index_file.close()
+
+    def _set_last_batch(self, batch_id: int) -> None:
+        """Registers batch as the most recently persisted one.
+        batch_id (int): Batch id/hash.
+        """
+        if self._last_batch is not None:
+            self._next_batch[self._last_batch] = batch_id
+        self._last_batch = batch_id
 
     @property
     def _index_path(self) -> Path:
         """Returns full path to index file.
         RETURNS (Path): Full path to index file.
         """
-        assert self._path is not None
-        return self._path / BatchCache._INDEX_NAME
+        # Only used with a configured cache directory.
+        return cast(Path, self._path) / BatchCache._INDEX_NAME
 
     def _batch_path(self, batch_id: int) -> Path:
         """Returns full path to batch file.
         batch_id (int): Batch id/hash
         RETURNS (Path): Full path to batch file.
         """
-        assert self._path is not None
-        return self._path / f"{batch_id}.spacy"
+        return cast(Path, self._path) / f"{batch_id}.spacy"
 
     @staticmethod
     def _doc_id(doc: Doc) -> int:
@@ -117,7 +203,17 @@ class BatchCache:
         doc (Doc): Doc to generate a unique ID for.
         RETURN (int): Unique ID for this doc.
         """
-        return numpy.sum(doc.to_array(["ORTH"]), dtype=numpy.uint64).item()
+        return BatchCache._hash(doc.to_array(["ORTH"]).astype("<u8").tobytes())
+
+    def _get_doc_id(self, doc: Doc) -> int:
+        """Get unique ID for one doc, reusing it if it has been computed for this Doc instance before.
+        doc (Doc): Doc to get a unique ID for.
+        RETURN (int): Unique ID for this doc.
+        """
+        doc_id = self._doc_ids.get(doc)
+        if doc_id is None:
+            doc_id = self._doc_ids[doc] = self._doc_id(doc)
+        return doc_id
 
     @staticmethod
     def _batch_id(doc_ids: Iterable[int]) -> int:
@@ -125,9 +221,57 @@ class BatchCache:
         doc_ids (Iterable[int]): doc ids
         RETURN (int): Unique ID for this batch.
         """
-        return numpy.sum(
-            numpy.asarray(doc_ids, dtype=numpy.uint64), dtype=numpy.uint64
-        ).item()
+        doc_ids = list(doc_ids)
+        return BatchCache._hash(struct.pack(f"<{len(doc_ids)}Q", *doc_ids))
+
+    @staticmethod
+    def _hash(data: bytes) -> int:
+        """Generate a 64-bit hash. This has to be stable across processes and platforms, as the resulting IDs are
+        persisted in the cache index.
+        data (bytes): Data to hash.
+        RETURN (int): 64-bit hash of data.
+        """
+        return int.from_bytes(
+            hashlib.blake2b(data, digest_size=8).digest(), byteorder="little"
+        )
+
+    def _load_batch(self, batch_id: int) -> "_LoadedBatch":
+        """Loads batch of docs from disk.
+        batch_id (int): Batch id/hash.
+        RETURNS (_LoadedBatch): Loaded batch.
+        """
+        assert self._vocab is not None
+        # The batch file is mapped into memory instead of being read into an intermediate bytes object, as DocBin
+        # decompresses it right away anyway.
+        with open(self._batch_path(batch_id), "rb") as batch_file, mmap.mmap(
+            batch_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as batch_data:
+            doc_bin = DocBin().from_bytes(batch_data)  # type: ignore[arg-type]
+        return _LoadedBatch(doc_bin, self._vocab)
+
+    def _prefetch(self, batch_id: Optional[int]) -> None:
+        """Starts loading batch in the background, so it's ready once docs in it are requested.
+        batch_id (Optional[int]): Batch id/hash. If None, nothing is prefetched.
+        """
+        if (
+            batch_id is None
+            or batch_id in self._loaded_docs
+            or len(self._loaded_docs) >= self.max_batches_in_mem
+        ):
+            return
+        if self._loader is None:
+            self._loader = ThreadPoolExecutor(max_workers=1)
+            self._loader_pid = os.getpid()
+        self._prefetched = (batch_id, self._loader.submit(self._load_batch, batch_id))
+
+    def _reset_loader_after_fork(self) -> None:
+        """Discards background loader and prefetched batch if this process has been forked since the loader was
+        started, as the loader's worker thread doesn't exist in this process.
+        """
+        if self._loader is not None and self._loader_pid != os.getpid():
+            self._loader = None
+            self._loader_pid = None
+            self._prefetched = None
 
     def add(self, doc: Doc) -> None:
         """Adds processed doc. Note: Adding a doc does _not_ mean that this doc is immediately persisted to disk. This
@@ -138,29 +282,32 @@ class BatchCache:
             return
 
         self._cache_queue.append(doc)
-        self._stats["added"] += 1
-        if len(self._cache_queue) == self._batch_size:
+        self._n_added += 1
+        if len(self._cache_queue) >= self._batch_size:
             self._persist()
 
     def _persist(self) -> None:
         """Persists all processed docs in the queue to disk as one file."""
-        assert self._path
-
-        doc_ids = [self._doc_id(doc) for doc in self._cache_queue]
+        doc_ids = [self._get_doc_id(doc) for doc in self._cache_queue]
         batch_id = self._batch_id(doc_ids)
 
         for doc_id in doc_ids:
             self._doc2batch[doc_id] = batch_id
+        self._set_last_batch(batch_id)
 
         batch_path = self._batch_path(batch_id)
         DocBin(docs=self._cache_queue, store_user_data=True).to_disk(batch_path)
-        srsly.write_jsonl(
-            self._index_path,
-            lines=[{str(doc_id): str(batch_id)} for doc_id in doc_ids],
-            append=True,
-            append_new_line=False,
-        )
-        self._stats["persisted"] += len(self._cache_queue)
+        index = numpy.empty(len(doc_ids), dtype=BatchCache._INDEX_DTYPE)
+        index["doc"] = doc_ids
+        index["batch"] = batch_id
+        if self._index_file is None:
+            self._index_file = open(self._index_path, "ab")
+            if self._index_file.tell() == 0:
+                self._index_file.write(BatchCache._INDEX_HEADER)
+        self._index_file.write(index.tobytes())
+        # Flush right away, so that the index is complete if the process terminates.
+        self._index_file.flush()
+        self._n_persisted += len(self._cache_queue)
         self._cache_queue = []
 
     def __contains__(self, doc: Doc) -> bool:
@@ -168,10 +315,14 @@ class BatchCache:
         doc (Doc): Doc to check for.
         RETURNS (bool): Whether doc has been processed and cached.
         """
-        if self._doc_id(doc) not in self._doc2batch:
-            self._stats["missed_contains"] += 1
+        # Without a cache directory, nothing is ever cached.
+        if self._path is None:
+            self._n_missed_contains += 1
             return False
-        self._stats["hit_contains"] += 1
+        if self._get_doc_id(doc) not in self._doc2batch:
+            self._n_missed_contains += 1
+            return False
+        self._n_hit_contains += 1
         return True
 
     def __getitem__(self, doc: Doc) -> Optional[Doc]:
@@ -181,38 +332,75 @@ class BatchCache:
         doc (Doc): Unprocessed doc whose processed equivalent should be returned.
         RETURNS (Optional[Doc]): Cached and processed version of doc, if available. Otherwise None.
         """
-        doc_id = self._doc_id(doc)
+        # Without a cache directory, nothing is ever cached.
+        if self._path is None:
+            self._n_missed += 1
+            return None
+
+        doc_id = self._get_doc_id(doc)
         batch_id = self._doc2batch.get(doc_id, None)
 
         # Doc is not in cache.
-        if not batch_id:
-            self._stats["missed"] += 1
+        if batch_id is None:
+            self._n_missed += 1
             return None
-        self._stats["hit"] += 1
+        self._n_hit += 1
 
         # Doc's batch is currently not loaded.
         if batch_id not in self._loaded_docs:
-            if self._path is None:
-                raise ValueError(
-                    "Cache directory path was not configured. Documents can't be read from cache."
-                )
             if self._vocab is None:
                 raise ValueError(
                     "Vocab must be set in order to Cache.__get_item__() to work."
                 )
 
-            # Discard batch, if maximal number of batches would be exceeded otherwise.
-            if len(self._loaded_docs) == self.max_batches_in_mem:
-                self._loaded_docs.pop(self._batch_hashes[0])
-                self._batch_hashes = self._batch_hashes[1:]
-
-            # Load target batch.
-            self._batch_hashes.append(batch_id)
-            self._loaded_docs[batch_id] = {
-                self._doc_id(proc_doc): proc_doc
-                for proc_doc in DocBin()
-                .from_disk(self._batch_path(batch_id))
-                .get_docs(self._vocab)
-            }
+            self._reset_loader_after_fork()
+
+            # Load target batch, unless it has been prefetched already.
+            if self._prefetched is not None and self._prefetched[0] == batch_id:
+                self._loaded_docs[batch_id] = self._prefetched[1].result()
+                self._prefetched = None
+            else:
+                # Discard prefetched batch, as it wasn't needed, and least recently used batch, if maximal number of
+                # batches would be exceeded otherwise.
+                self._prefetched = None
+                if len(self._loaded_docs) >= self.max_batches_in_mem:
+                    self._loaded_docs.popitem(last=False)
+                self._loaded_docs[batch_id] = self._load_batch(batch_id)
+            self._prefetch(self._next_batch.get(batch_id))
+        else:
+            self._loaded_docs.move_to_end(batch_id)
 
         return self._loaded_docs[batch_id][doc_id]
+
+
+class _LoadedBatch:
+    """Batch of docs loaded from disk. Docs are deserialized only once they (or docs after them) are requested."""
+
+    def __init__(self, doc_bin: DocBin, vocab: Vocab):
+        """Initialize loaded batch.
+        doc_bin (DocBin): Serialized docs.
+        vocab (Vocab): Vocab used for deserializing docs.
+        """
+        # Doc IDs can be computed from the serialized token attributes directly, in the same way
+        # BatchCache._doc_id() does it for Doc instances.
+        orth_col = doc_bin.attrs.index(ORTH)
+        self._doc_ids = [
+            BatchCache._hash(tokens[:, orth_col].astype("<u8").tobytes())
+            for tokens in doc_bin.tokens
+        ]
+        # Docs are deserialized in order, as DocBin doesn't support deserializing individual docs.
+        self._doc_iter = doc_bin.get_docs(vocab)
+        self._docs: Dict[int, Doc] = {}
+        self._n_deserialized = 0
+
+    def __getitem__(self, doc_id: int) -> Doc:
+        """Returns doc with the specified ID, deserializing it if necessary.
+        doc_id (int): Doc id/hash.
+        RETURNS (Doc): Deserialized doc.
+        """
+        while doc_id not in self._docs:
+            if self._n_deserialized == len(self._doc_ids):
+                raise KeyError(doc_id)
+            self._docs[self._doc_ids[self._n_deserialized]] = next(self._doc_iter)
+            self._n_deserialized += 1
+        return self._docs[doc_id]
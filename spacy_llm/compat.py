@@ -50,3 +50,27 @@ try:
 except ImportError:
     accelerate = None
     has_accelerate = False
+
+try:
+    import orjson
+
+    has_orjson = True
+except ImportError:
+    orjson = None
+    has_orjson = False
+
+try:
+    import bitsandbytes
+
+    has_bitsandbytes = True
+except ImportError:
+    bitsandbytes = None
+    has_bitsandbytes = False
+
+try:
+    import vllm
+
+    has_vllm = True
+except ImportError:
+    vllm = None
+    has_vllm = False
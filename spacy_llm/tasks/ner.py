@@ -13,7 +13,6 @@ from ..util import split_labels
 from .templates import read_template
 from .util import SpanExample, SpanTask
 
-_DEFAULT_NER_TEMPLATE_V1 = read_template("ner")
 _DEFAULT_NER_TEMPLATE_V2 = read_template("ner.v2")
 
 
@@ -51,7 +50,7 @@ def make_ner_task(
     )
     return NERTask(
         labels=labels_list,
-        template=_DEFAULT_NER_TEMPLATE_V1,
+        template=read_template("ner"),
         examples=span_examples,
         normalizer=normalizer,
         alignment_mode=alignment_mode,
@@ -167,19 +166,14 @@ class NERTask(SpanTask):
         nlp (Language): Language instance.
         labels (List[str]): Optional list of labels.
         """
-
-        examples = get_examples()
-
         if not labels:
             labels = list(self._label_dict.values())
 
         if not labels:
-            label_set = set()
-
-            for eg in examples:
-                for ent in eg.reference.ents:
-                    label_set.add(ent.label_)
-            labels = list(label_set)
+            # Examples are only read if they're needed. Labels are sorted to keep their order reproducible.
+            labels = sorted(
+                {ent.label_ for eg in get_examples() for ent in eg.reference.ents}
+            )
 
         self._label_dict = {self._normalizer(label): label for label in labels}
 
@@ -1,10 +1,12 @@
+import functools
 from pathlib import Path
 
 TEMPLATE_DIR = Path(__file__).parent
 
 
+@functools.lru_cache()
 def read_template(name: str) -> str:
-    """Read a template"""
+    """Read a template. Templates are read from disk only once per process."""
 
     path = TEMPLATE_DIR / f"{name}.jinja"
 
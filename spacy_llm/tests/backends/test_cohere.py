@@ -62,7 +62,8 @@ def test_cohere_api_response_when_error():
     prompt = "Count the number of characters in this string: hello"
     num_prompts = 3  # arbitrary number to check multiple inputs
     with pytest.raises(ValueError):
-        cohere(prompts=[prompt] * num_prompts)
+        # Responses are generated lazily, so we have to consume them to trigger the request.
+        list(cohere(prompts=[prompt] * num_prompts))
 
 
 @pytest.mark.skipif(has_cohere_key is False, reason="Cohere API key not available")
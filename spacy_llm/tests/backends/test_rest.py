@@ -1,12 +1,19 @@
 # mypy: ignore-errors
 import copy
+import io
+import pickle
 import re
+import threading
 from typing import Iterable
 
 import pytest
+import requests
 import spacy
+import srsly  # type: ignore[import]
 from spacy.tokens import Doc
 
+from ...backends.rest import base
+from ...backends.rest.openai import Endpoints, OpenAIBackend
 from ...registry import registry
 from ..compat import has_openai_key
 
@@ -42,6 +49,37 @@ def test_initialization():
     nlp("This is a test.")
 
 
+def test_concurrency_config():
+    """Test that concurrency settings are consumed by the backend and not passed on to the API."""
+    nlp = spacy.blank("en")
+    cfg = copy.deepcopy(PIPE_CFG)
+    cfg["backend"]["api"] = "NoOp"
+    cfg["backend"]["config"] = {
+        "model": "NoOp",
+        "max_workers": 4,
+        "max_concurrent_requests": 2,
+    }
+    llm = nlp.add_pipe("llm", config=cfg)
+    backend = llm._backend
+    assert backend._config == {"model": "NoOp"}
+    assert backend._max_workers == 4
+    assert backend._max_concurrent_requests == 2
+
+    # Backend has to survive pickling for multiprocessing.
+    backend = pickle.loads(pickle.dumps(backend))
+    assert backend._max_concurrent_requests == 2
+    nlp("This is a test.")
+
+
+def test_connection_pool_size():
+    """Test that the connection pool fits all requests that may be in flight."""
+    backend = registry.llm_backends.get("spacy.REST.v1")(
+        api="NoOp",
+        config={"model": "NoOp", "max_workers": 4, "max_concurrent_requests": 16},
+    )
+    assert backend._session.get_adapter("https://")._pool_maxsize == 16
+
+
 @pytest.mark.skipif(has_openai_key is False, reason="OpenAI API key not available")
 @pytest.mark.external
 def test_model_error_handling():
@@ -103,3 +141,154 @@ def test_max_time_error_handling():
                 },
             },
         )
+
+
+@pytest.mark.parametrize("use_orjson", (False, True))
+def test_json_serialization(use_orjson: bool, monkeypatch):
+    """Test (de-)serialization of request and response bodies with and without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(base, "has_orjson", use_orjson)
+    content = '{"choices": [{"text": "Ünïcödé"}], "n": 1}'.encode("utf-8")
+    assert base.load_json(content) == {"choices": [{"text": "Ünïcödé"}], "n": 1}
+    assert base.load_json(base.dump_json(base.load_json(content))) == base.load_json(
+        content
+    )
+
+
+def test_retry_after(monkeypatch):
+    """Test that retries respect the API's Retry-After header."""
+    backend = registry.llm_backends.get("spacy.REST.v1")(
+        api="NoOp", config={"model": "NoOp"}, max_tries=3, interval=0.1
+    )
+    sleeps = []
+    monkeypatch.setattr(base.time, "sleep", sleeps.append)
+
+    def _response(status_code: int, retry_after: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers["Retry-After"] = retry_after
+        return response
+
+    responses = iter(
+        [_response(429, "7"), _response(503, "Fri, 31 Dec 1999 23:59:59 GMT")]
+        + [_response(200, "")]
+    )
+    response = backend.retry(lambda url: next(responses), url="")
+    assert response.status_code == 200
+    assert len(sleeps) == 2
+    assert sleeps[0] == 7
+    # Unparseable Retry-After headers fall back to exponential backoff with jitter.
+    assert 0.1 <= sleeps[1] <= 0.3
+
+
+def _openai_chat_backend(
+    monkeypatch, responses: Iterable[requests.Response], strict: bool, **config
+) -> OpenAIBackend:
+    """Creates OpenAI backend for the chat endpoint that returns the specified responses instead of querying the API.
+    responses (Iterable[requests.Response]): Responses to return, in order.
+    strict (bool): Whether to raise errors returned by the API.
+    config: Additional backend config.
+    RETURNS (OpenAIBackend): OpenAI backend.
+    """
+    monkeypatch.setattr(OpenAIBackend, "credentials", property(lambda self: {}))
+    backend = OpenAIBackend(
+        config={"model": "gpt-3.5-turbo", "url": Endpoints.CHAT.value, **config},
+        strict=strict,
+        max_tries=1,
+        interval=1,
+        max_request_time=30,
+    )
+    responses = iter(responses)
+    lock = threading.Lock()
+
+    def _post(url: str, **kwargs) -> requests.Response:
+        with lock:
+            return next(responses)
+
+    monkeypatch.setattr(backend._session, "post", _post)
+    return backend
+
+
+def _response(body: bytes, content_type: str = "application/json") -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response.raw = io.BytesIO(body)
+    return response
+
+
+@pytest.mark.parametrize("strict", (False, True))
+def test_openai_stream_consumption(strict: bool, monkeypatch):
+    """Test that streamed chat completions are assembled into a single response, and that error events are handled
+    like errors in non-streamed responses.
+    """
+    error_event = b'{"error": {"message": "Oops", "type": "server_error"}}'
+    backend = _openai_chat_backend(
+        monkeypatch,
+        [
+            _response(
+                b'data: {"choices": [{"delta": {"role": "assistant"}}]}\n\n'
+                b'data: {"choices": [{"delta": {"content": "Hello"}}]}\n\n'
+                b'data: {"choices": [{"delta": {"content": " world"}}]}\n\n'
+                b'data: {"choices": [{"delta": {}, "finish_reason": "stop"}]}\n\n'
+                b'data: {"choices": [], "usage": {"total_tokens": 3}}\n\n'
+                b"data: [DONE]\n\n",
+                "text/event-stream",
+            ),
+            _response(b"data: " + error_event + b"\n\n", "text/event-stream"),
+        ],
+        strict=strict,
+        max_workers=1,
+        stream=True,
+    )
+
+    assert list(backend(["Hi"])) == ["Hello world"]
+    if strict:
+        with pytest.raises(ValueError, match="Oops"):
+            list(backend(["Hi"]))
+    else:
+        (response,) = list(backend(["Hi"]))
+        assert srsly.json_loads(response) == srsly.json_loads(error_event)
+
+
+@pytest.mark.parametrize("url", (Endpoints.CHAT.value, Endpoints.NON_CHAT.value))
+def test_openai_stream_only_for_chat(url: str, monkeypatch):
+    """Test that `stream` is only sent to the chat endpoint."""
+    model = "gpt-3.5-turbo" if url == Endpoints.CHAT else "text-davinci-003"
+    backend = _openai_chat_backend(
+        monkeypatch, [], strict=True, model=model, url=url, stream=True
+    )
+    bodies = []
+
+    def _post(url: str, data: bytes, **kwargs) -> requests.Response:
+        bodies.append(srsly.json_loads(data))
+        if url == Endpoints.CHAT:
+            return _response(
+                b'data: {"choices": [{"delta": {"content": "Hello"}}]}\n\n',
+                "text/event-stream",
+            )
+        return _response(b'{"choices": [{"text": "Hello"}]}')
+
+    monkeypatch.setattr(backend._session, "post", _post)
+    assert list(backend(["Hi"])) == ["Hello"]
+    assert bodies[0].get("stream") is (True if url == Endpoints.CHAT else None)
+
+
+def test_openai_error_mid_batch(monkeypatch):
+    """Test that a non-strict backend returns exactly one response per prompt if a request fails mid-batch."""
+    response = b'{"choices": [{"message": {"role": "assistant", "content": "Hello"}}]}'
+    error = b'{"error": {"message": "Oops", "type": "server_error"}}'
+    backend = _openai_chat_backend(
+        monkeypatch,
+        [
+            _response(response),
+            _response(response),
+            _response(error),
+            _response(response),
+        ],
+        strict=False,
+        max_workers=1,
+    )
+    responses = list(backend(["Hi"] * 4))
+    assert responses == ["Hello", "Hello", error.decode("utf-8"), error.decode("utf-8")]
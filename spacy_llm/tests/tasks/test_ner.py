@@ -763,7 +763,7 @@ def test_ner_init(noop_config):
 
     assert set(task._label_dict.values()) == set()
     nlp.initialize(lambda: examples)
-    assert set(task._label_dict.values()) == {"PER", "LOC"}
+    assert list(task._label_dict.values()) == ["LOC", "PER"]
 
 
 def test_ner_serde(noop_config):
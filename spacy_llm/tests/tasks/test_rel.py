@@ -15,9 +15,10 @@ from spacy_llm.util import assemble_from_config, split_labels
 from ..compat import has_openai_key
 
 EXAMPLES_DIR = Path(__file__).parent / "examples"
+FEWSHOT_EXAMPLES_PATH = str(EXAMPLES_DIR / "rel_examples.jsonl")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def zeroshot_cfg_string():
     return """
     [nlp]
@@ -46,7 +47,7 @@ def zeroshot_cfg_string():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def fewshot_cfg_string():
     return f"""
     [nlp]
@@ -68,7 +69,7 @@ def fewshot_cfg_string():
 
     [components.llm.task.examples]
     @misc = "spacy.FewShotReader.v1"
-    path = {str(EXAMPLES_DIR / "rel_examples.jsonl")}
+    path = {FEWSHOT_EXAMPLES_PATH}
 
     [components.llm.backend]
     @llm_backends = "spacy.REST.v1"
@@ -79,7 +80,7 @@ def fewshot_cfg_string():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def noop_config():
     return """
     [nlp]
@@ -128,9 +129,10 @@ def test_rel_config(cfg_string, request: FixtureRequest):
     labels = orig_config["components"]["llm"]["task"]["labels"]
     labels = split_labels(labels)
     assert isinstance(task, Labeled)
-    assert task.labels == tuple(labels)
-    assert pipe.labels == task.labels
-    assert nlp.pipe_labels["llm"] == list(task.labels)
+    task_labels = task.labels
+    assert task_labels == tuple(labels)
+    assert pipe.labels == task_labels
+    assert nlp.pipe_labels["llm"] == list(task_labels)
 
 
 @pytest.mark.external
@@ -1,3 +1,5 @@
+import re
+import sys
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Union
 
@@ -6,6 +8,8 @@ from spacy.language import Language
 from spacy.util import SimpleFrozenDict, get_sourced_components, load_config
 from spacy.util import load_model_from_config
 
+_LABEL_SEPARATOR = re.compile(r"\s*,\s*")
+
 
 def split_labels(labels: Union[str, Iterable[str]]) -> List[str]:
     """Split a comma-separated list of labels.
@@ -16,8 +20,14 @@ def split_labels(labels: Union[str, Iterable[str]]) -> List[str]:
     """
     if not labels:
         return []
-    labels = labels.split(",") if isinstance(labels, str) else labels
-    return [label.strip() for label in labels]
+    if isinstance(labels, str):
+        # Splitting on commas with surrounding whitespace strips all labels in one pass.
+        labels = labels.strip()
+        labels = _LABEL_SEPARATOR.split(labels) if labels else []
+    else:
+        labels = [label.strip() for label in labels]
+    # Labels are interned, so that label lists split from the same config share their strings and compare by identity.
+    return [sys.intern(label) for label in labels]
 
 
 def assemble_from_config(config: Config) -> Language:
@@ -30,7 +40,10 @@ def assemble_from_config(config: Config) -> Language:
     config = config.interpolate()
     sourced = get_sourced_components(config)
     nlp._link_components()
-    with nlp.select_pipes(disable=[*sourced]):
+    if sourced:
+        with nlp.select_pipes(disable=list(sourced)):
+            nlp.initialize()
+    else:
         nlp.initialize()
     return nlp
 